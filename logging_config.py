@@ -5,13 +5,87 @@ Configurable via environment variables:
 - CENTRALIZED_LOGGING_ENABLED: true/false (default: true)
 - CENTRALIZED_LOGGING_PATH: host path for logs (default: /app/logs)
 """
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
 from datetime import datetime
 
 
+# Bounded so a stalled log volume cannot grow memory without limit
+LOG_QUEUE_MAXSIZE = 20000
+
+
+class DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that discards the oldest pending record when the queue is full."""
+    
+    def enqueue(self, record):
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+# (logger, queue handler, listener) of the active queue logging setup (one per process)
+_active_queue_logging = None
+
+
+def start_queue_logging(logger: logging.Logger, handlers: list) -> logging.handlers.QueueListener:
+    """
+    Route a logger through a bounded queue drained by a background listener.
+    
+    Any listener started by a previous call is stopped first, so repeated
+    setup does not leave extra threads or open file handlers behind.
+    
+    Args:
+        logger: Logger that should enqueue records instead of writing them
+        handlers: Handlers the listener thread writes records to
+        
+    Returns:
+        The started QueueListener (stopped automatically at interpreter exit)
+    """
+    global _active_queue_logging
+    stop_queue_logging()
+    
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    queue_handler = DropOldestQueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _active_queue_logging = (logger, queue_handler, listener)
+    return listener
+
+
+def stop_queue_logging():
+    """
+    Stop the active listener, flushing queued records and closing its handlers.
+    
+    The queue handler is detached from its logger first, so no record is
+    enqueued after the listener has stopped draining the queue.
+    """
+    global _active_queue_logging
+    active, _active_queue_logging = _active_queue_logging, None
+    if active is None:
+        return
+    logger, queue_handler, listener = active
+    logger.removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+# Flush pending records before exit, including sys.exit() on error paths
+atexit.register(stop_queue_logging)
+
+
 class CentralizedLogger:
     """
     Centralized logging configuration that writes to both stdout and host files.
@@ -44,12 +118,13 @@ class CentralizedLogger:
         self._setup_logging()
     
     def _setup_logging(self):
-        """Configure logging with multiple handlers."""
+        """Configure logging with multiple handlers behind a background queue."""
         # Create logger
         logger = logging.getLogger()
         logger.setLevel(logging.INFO)
         
-        # Clear any existing handlers
+        # Stop a listener left by a previous setup, then clear any existing handlers
+        stop_queue_logging()
         logger.handlers.clear()
         
         # Create formatters
@@ -61,9 +136,10 @@ class CentralizedLogger:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(detailed_formatter)
-        logger.addHandler(console_handler)
+        handlers = [console_handler]
         
         # 2. Main log file handler - all logs (only if enabled and directory is writable)
+        file_error = None
         if self.logging_enabled:
             try:
                 file_handler = logging.handlers.RotatingFileHandler(
@@ -74,54 +150,60 @@ class CentralizedLogger:
                 )
                 file_handler.setLevel(logging.INFO)
                 file_handler.setFormatter(detailed_formatter)
-                logger.addHandler(file_handler)
-                
-                # Log initialization
-                logger.info(f"=== {self.service_name.upper()} SERVICE STARTED ===")
-                logger.info(f"Logging to: {self.log_file} (all levels: INFO, WARNING, ERROR)")
-                logger.info(f"Log path: {self.log_dir}")
-                
+                handlers.append(file_handler)
             except (PermissionError, OSError) as e:
                 # If file logging fails, continue with console only
-                logger.warning(f"File logging disabled: {e}")
-                logger.info(f"=== {self.service_name.upper()} SERVICE STARTED (Console Only) ===")
-        else:
+                file_error = e
+        
+        # Records are queued by the caller and written by a listener thread,
+        # so stream/file I/O never blocks the request path.
+        self._listener = start_queue_logging(logger, handlers)
+        
+        if not self.logging_enabled:
             # Centralized logging disabled via environment variable
-            logger.info(f"=== {self.service_name.upper()} SERVICE STARTED (Console Only - Centralized Logging Disabled) ===")
+            logger.info("=== %s SERVICE STARTED (Console Only - Centralized Logging Disabled) ===", self.service_name.upper())
+        elif file_error is not None:
+            logger.warning("File logging disabled: %s", file_error)
+            logger.info("=== %s SERVICE STARTED (Console Only) ===", self.service_name.upper())
+        else:
+            # Log initialization
+            logger.info("=== %s SERVICE STARTED ===", self.service_name.upper())
+            logger.info("Logging to: %s (all levels: INFO, WARNING, ERROR)", self.log_file)
+            logger.info("Log path: %s", self.log_dir)
         
-        logger.info(f"Timestamp: {datetime.now().isoformat()}")
+        logger.info("Timestamp: %s", datetime.now().isoformat())
     
     def log_step(self, step_name: str, details: str = ""):
         """Log a processing step."""
-        message = f"STEP: {step_name}"
         if details:
-            message += f" - {details}"
-        logging.info(message)
+            logging.info("STEP: %s - %s", step_name, details)
+        else:
+            logging.info("STEP: %s", step_name)
     
     def log_action(self, action: str, details: str = ""):
         """Log an action being taken."""
-        message = f"ACTION: {action}"
         if details:
-            message += f" - {details}"
-        logging.info(message)
+            logging.info("ACTION: %s - %s", action, details)
+        else:
+            logging.info("ACTION: %s", action)
     
     def log_error(self, error_msg: str, exception: Exception = None):
         """Log an error with optional exception details."""
         if exception:
-            logging.error(f"ERROR: {error_msg} - Exception: {str(exception)}", exc_info=True)
+            logging.error("ERROR: %s - Exception: %s", error_msg, exception, exc_info=True)
         else:
-            logging.error(f"ERROR: {error_msg}")
+            logging.error("ERROR: %s", error_msg)
     
     def log_success(self, operation: str, details: str = ""):
         """Log a successful operation."""
-        message = f"SUCCESS: {operation}"
         if details:
-            message += f" - {details}"
-        logging.info(message)
+            logging.info("SUCCESS: %s - %s", operation, details)
+        else:
+            logging.info("SUCCESS: %s", operation)
     
     def log_warning(self, warning_msg: str):
         """Log a warning."""
-        logging.warning(f"WARNING: {warning_msg}")
+        logging.warning("WARNING: %s", warning_msg)
 
 
 def setup_service_logging(service_name: str, log_dir: str = "/app/logs") -> CentralizedLogger:
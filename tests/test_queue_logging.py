@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the queue-based logging used by the centralized and fallback configurations.
+"""
+
+import logging
+import logging.handlers
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+import logging_config
+import trigger_vectorization
+
+
+def _record(msg):
+    return logging.LogRecord("test", logging.INFO, __file__, 0, msg, None, None)
+
+
+class TestDropOldestQueueHandler(unittest.TestCase):
+    """A full queue discards its oldest record instead of the new one."""
+
+    def assert_drops_oldest(self, handler_class):
+        log_queue = queue.Queue(maxsize=2)
+        handler = handler_class(log_queue)
+        for msg in ("first", "second", "third"):
+            handler.handle(_record(msg))
+
+        kept = [log_queue.get_nowait().getMessage() for _ in range(log_queue.qsize())]
+        self.assertEqual(kept, ["second", "third"])
+
+    def test_centralized_handler_drops_oldest(self):
+        self.assert_drops_oldest(logging_config.DropOldestQueueHandler)
+
+    def test_fallback_handler_drops_oldest(self):
+        self.assert_drops_oldest(trigger_vectorization._DropOldestQueueHandler)
+
+    def test_fallback_queue_size_matches_centralized(self):
+        self.assertEqual(trigger_vectorization.LOG_QUEUE_MAXSIZE, logging_config.LOG_QUEUE_MAXSIZE)
+
+
+class TestCentralizedListenerLifecycle(unittest.TestCase):
+    """Repeated setup keeps a single listener thread and closes the old handlers."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root_handlers = logging.getLogger().handlers[:]
+
+    def tearDown(self):
+        logging_config.stop_queue_logging()
+        logging.getLogger().handlers[:] = self.root_handlers
+        self.tmp_dir.cleanup()
+
+    def test_repeated_setup_keeps_one_listener(self):
+        threads_before = threading.active_count()
+        first = logging_config.setup_service_logging("queue-test", self.tmp_dir.name)
+        for _ in range(2):
+            logging_config.setup_service_logging("queue-test", self.tmp_dir.name)
+
+        self.assertEqual(threading.active_count(), threads_before + 1)
+        file_handlers = [h for h in first._listener.handlers
+                         if isinstance(h, logging.handlers.RotatingFileHandler)]
+        self.assertTrue(file_handlers)
+        self.assertIsNone(file_handlers[0].stream, "Replaced file handler should be closed")
+
+        logging_config.stop_queue_logging()
+        self.assertEqual(threading.active_count(), threads_before)
+
+    def test_repeated_start_replaces_queue_handler(self):
+        logger = logging.getLogger("queue-test-helper")
+        self.addCleanup(logger.handlers.clear)
+        for _ in range(2):
+            logging_config.start_queue_logging(logger, [logging.NullHandler()])
+
+        queue_handlers = [h for h in logger.handlers
+                          if isinstance(h, logging_config.DropOldestQueueHandler)]
+        self.assertEqual(len(queue_handlers), 1)
+
+        logging_config.stop_queue_logging()
+        self.assertEqual(logger.handlers, [])
+
+    def test_stop_is_idempotent(self):
+        logging_config.setup_service_logging("queue-test", self.tmp_dir.name)
+        logging_config.stop_queue_logging()
+        logging_config.stop_queue_logging()
+
+
+class TestFlushAtExit(unittest.TestCase):
+    """Queued records are written before the process exits via sys.exit(1)."""
+
+    def run_script(self, script):
+        return subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+
+    def test_centralized_logging_flushes_on_exit(self):
+        with tempfile.TemporaryDirectory() as log_dir:
+            result = self.run_script(
+                "import logging, sys\n"
+                "from logging_config import setup_service_logging\n"
+                f"setup_service_logging('flush-test', {log_dir!r})\n"
+                "for i in range(1000):\n"
+                "    logging.info('record %d', i)\n"
+                "sys.exit(1)\n"
+            )
+            self.assertEqual(result.returncode, 1)
+            log_content = (Path(log_dir) / "flush-test.log").read_text()
+            self.assertIn("record 999", log_content)
+
+    def test_fallback_logging_flushes_on_exit(self):
+        result = self.run_script(
+            "import sys\n"
+            "import trigger_vectorization as tv\n"
+            "tv._setup_fallback_logging()\n"
+            "for i in range(1000):\n"
+            "    tv.logger.info('record %d', i)\n"
+            "sys.exit(1)\n"
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("record 999", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
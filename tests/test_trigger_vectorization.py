@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for trigger_vectorization.py argument parsing, response handling and exit codes.
+"""
+
+import argparse
+import http.server
+import importlib.util
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from trigger_vectorization import RESPONSE_PREVIEW_BYTES, _parse_clients
+
+
+class ScriptTestCase(unittest.TestCase):
+    """Runs a copy of the script on its own, as shipped in the Docker image (fallback logging)."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.script = Path(self.tmp_dir.name) / "trigger_vectorization.py"
+        shutil.copy(REPO_ROOT / "trigger_vectorization.py", self.script)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_trigger(self, service_url="http://127.0.0.1:1", clients="client1", job_id="test_job"):
+        return subprocess.run(
+            [sys.executable, str(self.script),
+             "--vectorizationServiceUrl", service_url,
+             "--url", "metadata-test.json",
+             "--jobId", job_id,
+             "--clientsList", clients,
+             "--studyId", "test_study"],
+            cwd=self.tmp_dir.name,
+            capture_output=True,
+            text=True,
+            timeout=60
+        )
+
+
+class TestParseClients(unittest.TestCase):
+    """--clientsList parsing keeps the results of the original multi-pass parser."""
+
+    def test_json_array(self):
+        self.assertEqual(_parse_clients('["client1", "client2"]'), ["client1", "client2"])
+
+    def test_simple_array(self):
+        self.assertEqual(_parse_clients("[a, b]"), ["a", "b"])
+
+    def test_single_value(self):
+        self.assertEqual(_parse_clients("client1"), ["client1"])
+
+    def test_spaces_inside_client_ids_are_kept(self):
+        self.assertEqual(_parse_clients("[client a, client b]"), ["client a", "client b"])
+
+    def test_quotes_and_brackets_inside_client_ids_are_kept(self):
+        cases = {
+            "o'brien": ["o'brien"],
+            "[it's]": ["it's"],
+            "x[1]": ["x[1]"],
+            "[a]b": ["[a]b"],
+            "a,b": ["a,b"],
+            "['x', \"y\" ]": ["x", "y"],
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(_parse_clients(value), expected)
+
+    def test_invalid_values_are_rejected(self):
+        for value in ["[]", " ", '["a", 1]', '"solo"']:
+            with self.subTest(value=value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    _parse_clients(value)
+
+
+class TestInvalidClientsListExit(ScriptTestCase):
+    """An invalid --clientsList is reported as an argparse usage error."""
+
+    def test_exit_code_and_message(self):
+        result = self.run_trigger(clients="[]")
+
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("argument --clientsList", result.stderr)
+        self.assertIn("is not a non-empty list of client identifiers", result.stderr)
+
+
+class _StubVectorizationHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Answers POST /vectorize with the status code named in the request's jobId,
+    or with a 500 whose body is cut short when the jobId is "truncated".
+    """
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        job_id = json.loads(body)["jobId"]
+        if job_id == "truncated":
+            self.send_response(500)
+            self.send_header("Content-Length", "100")
+            self.end_headers()
+            self.wfile.write(b"short")
+            return
+        status = int(job_id)
+        self.send_response(status)
+        if status == 204:
+            self.end_headers()
+            return
+        payload = b"x" * (RESPONSE_PREVIEW_BYTES * 2)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@unittest.skipUnless(importlib.util.find_spec("requests"), "requests is not installed")
+class TestResponseHandling(ScriptTestCase):
+    """2xx responses succeed; error responses exit 1 with a capped body preview."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _StubVectorizationHandler)
+        cls.server_url = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_success_statuses(self):
+        for status in (200, 204):
+            with self.subTest(status=status):
+                result = self.run_trigger(service_url=self.server_url, job_id=str(status))
+                self.assertEqual(result.returncode, 0, result.stderr)
+                self.assertIn(f"succeeded. Response code: {status}", result.stderr)
+
+    def test_server_error_logs_capped_preview(self):
+        result = self.run_trigger(service_url=self.server_url, job_id="500")
+
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("500 Server Error", result.stderr)
+        self.assertIn(f"Response body (first {RESPONSE_PREVIEW_BYTES} bytes)", result.stderr)
+        self.assertIn("x" * RESPONSE_PREVIEW_BYTES, result.stderr)
+        self.assertNotIn("x" * (RESPONSE_PREVIEW_BYTES + 1), result.stderr)
+
+    def test_truncated_error_body_still_exits_cleanly(self):
+        result = self.run_trigger(service_url=self.server_url, job_id="truncated")
+
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("500 Server Error", result.stderr)
+        self.assertIn("Could not read response body", result.stderr)
+        self.assertNotIn("Traceback", result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,23 +1,123 @@
 #!/usr/bin/env python
-import requests
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 import argparse
-import os
 import json
-from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    # Optional fast serializer; fall back to the stdlib encoder
+    orjson = None
+
+SERVICE_NAME = "trigger-vectorization-pipeline"
+
+# Named module logger: calls go straight to this logger instead of through the
+# root-level logging.* helpers, which re-check root handlers on every call.
+logger = logging.getLogger(SERVICE_NAME)
+
+# Maximum number of response body bytes read for logging
+RESPONSE_PREVIEW_BYTES = 4096
+
+# Item separator inside a non-JSON "[client1, client2]" --clientsList value
+_CLIENT_SEP_RE = re.compile(r'\s*,\s*')
+
+# Shared HTTP session so repeated triggers reuse the adapter and keep-alive connection
+_SESSION = None
+
+
+def _get_session():
+    """Return the shared HTTP session, importing requests on first use."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+
+        adapter_options = {"pool_connections": 1, "pool_maxsize": 1}
+        _SESSION = requests.Session()
+        _SESSION.mount("http://", requests.adapters.HTTPAdapter(**adapter_options))
+        _SESSION.mount("https://", requests.adapters.HTTPAdapter(**adapter_options))
+    return _SESSION
+
+
+def _parse_clients(value):
+    """Parse --clientsList into a non-empty list of non-empty client strings."""
+    # First try standard JSON parsing
+    try:
+        clients = json.loads(value)
+    except json.JSONDecodeError:
+        # If standard JSON fails, try to fix common shell quote issues
+        fixed_input = value.strip()
+        if fixed_input.startswith('[') and fixed_input.endswith(']'):
+            # Shell-stripped quotes: [client1, client2] -> ["client1", "client2"]
+            items = _CLIENT_SEP_RE.split(fixed_input[1:-1].strip())
+            clients = [client for client in (item.strip('"\'') for item in items) if client]
+        else:
+            # Single value: wrap it in a list
+            cleaned = fixed_input.strip('"\'')
+            clients = [cleaned] if cleaned else []
+
+    # Validate in a single pass: a non-empty list of non-empty strings
+    if not (isinstance(clients, list) and clients
+            and all(isinstance(client, str) and client.strip() for client in clients)):
+        raise argparse.ArgumentTypeError(
+            f"{value!r} is not a non-empty list of client identifiers (supported formats: "
+            "JSON array '[\"client1\", \"client2\"]', simple array '[client1, client2]', "
+            "single value 'client1')"
+        )
+    return clients
+
+
+# Fallback copies of logging_config.DropOldestQueueHandler / start_queue_logging:
+# the Docker image ships only this script, so it cannot import logging_config.
+# Keep them (and LOG_QUEUE_MAXSIZE) in sync with logging_config.py.
+LOG_QUEUE_MAXSIZE = 20000
+
+
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """Fallback QueueHandler that discards the oldest pending record when full."""
+
+    def enqueue(self, record):
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+
+def _setup_fallback_logging():
+    """Log to stderr from a background thread when logging_config is unavailable."""
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s: %(message)s"))
+
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    root.addHandler(_DropOldestQueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    # Flush pending records before exit, including sys.exit(1) on error paths
+    atexit.register(listener.stop)
 
 def main():
     # Setup centralized logging
     try:
         from logging_config import setup_service_logging
-        logger_instance = setup_service_logging('trigger-vectorization-pipeline')
+        logger_instance = setup_service_logging(SERVICE_NAME)
         logger_instance.log_action("Starting Vectorization Pipeline Trigger")
         centralized_logging = True
     except ImportError:
         # Fallback for environments without centralized logging
-        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s: %(message)s")
-        logging.info("Starting Vectorization Pipeline Trigger - fallback logging")
+        _setup_fallback_logging()
+        logger.info("Starting Vectorization Pipeline Trigger - fallback logging")
         centralized_logging = False
 
     parser = argparse.ArgumentParser(description="Trigger the Vectorization Service via a POST request.")
@@ -27,55 +127,15 @@ def main():
                         help="The dataset URL to be vectorized.")
     parser.add_argument("--jobId", required=True,
                         help="Unique Job ID for the vectorization/aggregation process.")
-    parser.add_argument("--clientsList", required=True,
+    parser.add_argument("--clientsList", required=True, type=_parse_clients,
                         help="List of client identifiers as JSON array (e.g., --clientsList '[\"client1\", \"client2\"]')")
     parser.add_argument("--studyId", required=True,
                         help="Study identifier for Feature Extraction Tool API (required for both dev and prod modes)")
     # orchestratorUrl is now configured via environment variable in vectorization service
     args = parser.parse_args()
 
-    # Parse clientsList - Robust parsing for shell compatibility
-    try:
-        # First try standard JSON parsing
-        try:
-            clients_list = json.loads(args.clientsList)
-        except json.JSONDecodeError:
-            # If standard JSON fails, try to fix common shell quote issues
-            fixed_input = args.clientsList.strip()
-            
-            # Handle shell-stripped quotes: [client1, client2] -> ["client1", "client2"]
-            if fixed_input.startswith('[') and fixed_input.endswith(']'):
-                # Extract content between brackets
-                content = fixed_input[1:-1].strip()
-                if content:
-                    # Split by comma and clean each item
-                    items = [item.strip().strip('"\'') for item in content.split(',')]
-                    clients_list = [item for item in items if item]
-                else:
-                    clients_list = []
-            else:
-                # Try to parse as single value and wrap in list
-                cleaned = args.clientsList.strip().strip('"\'')
-                clients_list = [cleaned] if cleaned else []
-        
-        # Validate that it's a list of strings
-        if not isinstance(clients_list, list):
-            raise ValueError("clientsList must resolve to a list")
-        if not clients_list:
-            raise ValueError("clientsList cannot be empty")
-        if not all(isinstance(client, str) and client.strip() for client in clients_list):
-            raise ValueError("All clients must be non-empty strings")
-            
-        logging.info(f"Parsed clientsList: {clients_list}")
-        
-    except (json.JSONDecodeError, ValueError) as e:
-        logging.error(f"Invalid clientsList format: {args.clientsList}")
-        logging.error(f"Supported formats:")
-        logging.error(f"  - JSON array: '[\"client1\", \"client2\"]'")
-        logging.error(f"  - Simple array: '[client1, client2]'")
-        logging.error(f"  - Single value: 'client1'")
-        logging.error(f"Error: {e}")
-        sys.exit(1)
+    clients_list = args.clientsList
+    logger.info("Parsed clientsList: %s", clients_list)
 
     # Construct the POST body from the arguments
     request_body = {
@@ -85,27 +145,50 @@ def main():
         "studyId": args.studyId  # Always required now
     }
 
+    # Serialize once up front instead of letting requests re-encode json=
+    if orjson is not None:
+        payload = orjson.dumps(request_body)
+    else:
+        payload = json.dumps(request_body, separators=(",", ":")).encode("utf-8")
+
     # Build the full endpoint for the Vectorization Service
     vectorize_endpoint = f"{args.vectorizationServiceUrl.rstrip('/')}/vectorize"
 
-    logging.info(f"Sending POST to {vectorize_endpoint} with body: {request_body}")
+    logger.info("Sending POST to %s with body: %s", vectorize_endpoint, request_body)
+
+    # Imported only once the arguments are valid (for RequestException): requests
+    # pulls in urllib3/certifi/charset_normalizer, which --help and argument
+    # errors should not pay for
+    import requests
 
     # POST request to the Vectorization Service
+    resp = None
     try:
-        logging.info("Initiating HTTP POST request to vectorization service")
-        resp = requests.post(vectorize_endpoint, json=request_body, timeout=30)
-        logging.info(f"Response code: {resp.status_code}")
-        logging.info(f"Response body: {resp.text}")
-    except Exception as e:
-        logging.error(f"Error sending request: {e}")
-        sys.exit(1)
-
-    # Treat non-200 as failure
-    if resp.status_code != 200:
-        logging.error("Vectorization trigger request failed.")
+        logger.info("Initiating HTTP POST request to vectorization service")
+        # Stream so an error body is never held in memory beyond the logged preview
+        resp = _get_session().post(vectorize_endpoint, data=payload,
+                                   headers={"Content-Type": "application/json"},
+                                   timeout=30, stream=True)
+        resp.raise_for_status()
+        # Drain the body in fixed-size chunks so the connection returns to the pool
+        for _ in resp.iter_content(RESPONSE_PREVIEW_BYTES):
+            pass
+        logger.info("Vectorization trigger request succeeded. Response code: %d", resp.status_code)
+    except requests.RequestException as e:
+        logger.error("Vectorization trigger request failed: %s", e)
+        if e.response is not None:
+            try:
+                body_preview = next(e.response.iter_content(RESPONSE_PREVIEW_BYTES), b"")
+            except requests.RequestException as preview_error:
+                # Truncated body or read timeout: keep the failure exit path
+                logger.error("Could not read response body: %s", preview_error)
+            else:
+                logger.error("Response body (first %d bytes): %s", RESPONSE_PREVIEW_BYTES,
+                             body_preview.decode(e.response.encoding or "utf-8", errors="replace"))
         sys.exit(1)
-
-    logging.info("Vectorization trigger request succeeded.")
+    finally:
+        if resp is not None:
+            resp.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file